@@ -1,5 +1,6 @@
-from random import uniform
+from time import monotonic
 
+import numpy as np
 from qtpy.QtCore import QTimer
 from qtpy.QtWidgets import QApplication
 from qtpy.QtGui import QPalette, QColor
@@ -8,28 +9,29 @@ from qdigitalmeter import QDigitalMeter
 
 
 class Updater(QTimer):
-    samples = [-70, -70]
-    decaySamples = [-70, -70]
-    decayPeakTTL = 8
+    samples = np.full(2, -70.0)
+    decaySamples = np.full(2, -70.0)
+    decayPeakHold = 0.25  # seconds
+    decayPeakSpeed = 12  # dB per second
 
     def __init__(self, meter: QDigitalMeter, **kwargs):
         super().__init__(**kwargs)
         self.meter = meter
+        self.lastUpdate = monotonic()
+        self.decayPeakHoldUntil = self.lastUpdate
 
     def newSamples(self):
-        self.samples = [
-            uniform(-70, 0),
-            uniform(-70, 0),
-        ]
-
-        for n, sample in enumerate(self.samples):
-            if sample >= self.decaySamples[n]:
-                self.decayPeakTTL = 8
-                self.decaySamples[n] = sample
-            elif self.decayPeakTTL <= 0:
-                self.decaySamples[n] -= 0.4
-            else:
-                self.decayPeakTTL -= 1
+        now = monotonic()
+        elapsed = now - self.lastUpdate
+        self.lastUpdate = now
+
+        self.samples = np.random.uniform(-70, 0, size=2)
+
+        if (self.samples >= self.decaySamples).any():
+            self.decayPeakHoldUntil = now + self.decayPeakHold
+            self.decaySamples = np.maximum(self.decaySamples, self.samples)
+        elif now >= self.decayPeakHoldUntil:
+            self.decaySamples = np.maximum(self.decaySamples - self.decayPeakSpeed * elapsed, self.samples)
 
     def timerEvent(self, event):
         self.newSamples()
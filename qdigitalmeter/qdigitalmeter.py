@@ -16,29 +16,61 @@
 # along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
 
 from math import ceil
-from typing import Iterable
+from time import monotonic
+from typing import Iterable, Optional, Tuple
 
-from qtpy.QtCore import QPointF, QRectF, Qt, QPoint
+import numpy as np
+from qtpy import PYSIDE2, PYSIDE6
+from qtpy.QtCore import QEvent, QPointF, QRect, QRectF, Qt, QPoint
 from qtpy.QtGui import (
     QBrush,
     QColor,
-    QLinearGradient,
+    QImage,
     QPainter,
     QPen,
     QPixmap,
+    QPixmapCache,
     QFontDatabase,
+    QFont,
     QFontMetrics,
     QResizeEvent,
     QPaintEvent,
+    QRegion,
 )
 from qtpy.QtWidgets import QWidget
 
 from qdigitalmeter.scales import Scale, IECScale
 
 
+def _findCachedPixmap(key: str) -> Optional[QPixmap]:
+    """Lookup a pixmap in the global QPixmapCache, regardless of the Qt binding in use"""
+    pixmap = QPixmap()
+    try:
+        # PySide fills the given pixmap and returns a boolean
+        found = QPixmapCache.find(key, pixmap)
+    except TypeError:
+        # PyQt returns the pixmap, or None
+        return QPixmapCache.find(key)
+
+    return pixmap if found else None
+
+
+def _drawPixmapFragments(painter: QPainter, fragments: list, pixmap: QPixmap):
+    """Draw the fragments of the given pixmap, regardless of the Qt binding in use"""
+    if PYSIDE2 or PYSIDE6:
+        # PySide only binds the pointer-to-single-fragment variant
+        for fragment in fragments:
+            painter.drawPixmapFragments(fragment, 1, pixmap)
+    else:
+        painter.drawPixmapFragments(fragments, pixmap)
+
+
 class QDigitalMeter(QWidget):
     """DPM - Digital Peak Meter widget"""
 
+    # Time interval (seconds) the "smoothing" amount refers to
+    _SMOOTHING_INTERVAL = 1 / 30
+
     def __init__(
         self,
         parent=None,
@@ -52,11 +84,14 @@ class QDigitalMeter(QWidget):
         :param parent: Parent widget
         :param scale: The algorithm used to normalize the values in the [0-1] range
         :param steps: Incremental steps values at which indicators should be placed
-        :param smoothing: Amount of smoothing to apply to decreasing values, 0 to disable
+        :param smoothing: Amount of smoothing to apply to decreasing values (every 1/30 of second), 0 to disable
         :param unit: Unit string to draw at the bottom of the indicators
         """
 
         super().__init__(parent, **kwargs)
+        # Leave some room for the pixmaps created while resizing the widget(s)
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), 32768))
+
         self.valueSmoothing = smoothing
         self.scale = scale
         self.steps = steps
@@ -66,6 +101,7 @@ class QDigitalMeter(QWidget):
         self.borderPen = None
         self.clippingPen = None
         self.textPen = None
+        self._pens = ()
         self._updateColors()
 
         self.metersSpacing = 3
@@ -73,20 +109,47 @@ class QDigitalMeter(QWidget):
 
         font = QFontDatabase.systemFont(QFontDatabase.FixedFont)
         font.setPointSize(font.pointSize() - 3)
-        self.setFont(font)
-        font.setPointSize(font.pointSize() - 1)
-        self.unitFont = font
-
-        self.peaks = [self.scale.min, self.scale.min]
-        self.decayPeaks = [self.scale.min, self.scale.min]
-        self.clipping = {}
+        self._unitFont = QFont(font)
+        self._unitFont.setPointSize(font.pointSize() - 1)
+        self._fm = QFontMetrics(self.font())
+
+        # Normalized values, updated in-place by plot()
+        self.peaks = np.zeros(2, dtype=np.float32)
+        self.decayPeaks = np.zeros(2, dtype=np.float32)
+        self.clipping = np.zeros(2, dtype=bool)
+        self._scaledPeaks = np.zeros(2, dtype=np.float32)
+        # The values, and the scale, _scaledPeaks has been computed from
+        self._scaledFrom = np.full(2, np.nan, dtype=np.float32)
+        self._scaledWith = None
 
         self._currentSmoothing = self.valueSmoothing
+        self._lastUpdate = monotonic()
         self._meterPixmap = QPixmap()
-        self._outerScale = []
+        self._colorLUT = np.empty(0, dtype=np.uint32)
+        # Meters gradient, colors are fixed, positions depend on the scale range
+        self._gradientColors = np.array([(230, 0, 0), (255, 220, 0), (0, 220, 0), (0, 180, 50)]).T
+        self._gradientStops = np.zeros(4)
+        self._lastDbRange = None
+        # Pre-rendered meters, indexed by the "clipping" state, see _meterStrips()
+        self._strips = [None, None]
+        self._stripsKey = ""
+        self._outerScaleY = np.empty(0, dtype=np.int32)
+        self._outerScaleLevel = np.empty(0, dtype=np.int32)
+        self._outerScaleLabels = ()
+        self._outerScaleRects = ()
+        self._scaleMaxLabel = str(self.scale.max)
         self._outerScaleWidth = self.outerScaleWidth()
         self._canDisplayOuterScale = True
         self._innerScalePixmap = QPixmap()
+        self._innerScaleKey = ""
+        self._meterXs = []
+        self._meterW = 0
+        self._meterH = 0
+        self.updateMetersGeometry()
+        self._lastPeakPx, self._lastDecayPx = self.metersPixels()
+
+        # Set the font last, the resulting FontChange event updates the layout (see changeEvent)
+        self.setFont(font)
 
     def _updateColors(self):
         palette = self.palette()
@@ -94,16 +157,39 @@ class QDigitalMeter(QWidget):
         self.borderPen = QPen(palette.light().color())
         self.clippingPen = QPen(QColor(220, 50, 50))
         self.textPen = QPen(palette.windowText().color())
+        self._pens = (self.borderPen, self.clippingPen)
+
+    def changeEvent(self, event: QEvent):
+        super().changeEvent(event)
+
+        # Also sent when the font is changed by a stylesheet, or inherited from the parent
+        if event.type() == QEvent.Type.FontChange:
+            self._fm = QFontMetrics(self.font())
+            self.updateLayout()
+            self.update()
+
+    @property
+    def unitFont(self) -> QFont:
+        return self._unitFont
+
+    @unitFont.setter
+    def unitFont(self, font: QFont):
+        self._unitFont = font
+        self.updateLayout()
+        self.update()
 
     def setStyleSheet(self, stylesheet: str):
         super().setStyleSheet(stylesheet)
         self.style().polish(self)
         self._updateColors()
+        self.updateInnerScalePixmap()
+        self.updateMeterPixmap()
 
     def reset(self):
-        self.peaks = [self.scale.min] * len(self.peaks)
-        self.decayPeaks = [self.scale.min] * len(self.decayPeaks)
-        self.clipping = {}
+        self.peaks.fill(0)
+        self.decayPeaks.fill(0)
+        self.clipping.fill(False)
+        self._lastPeakPx, self._lastDecayPx = self.metersPixels()
 
         self.update()
 
@@ -120,82 +206,224 @@ class QDigitalMeter(QWidget):
 
         return int((self.width() - totalSpacing - outerScaleWidth) / metersCount)
 
+    def updateMetersGeometry(self):
+        """Cache the size, and horizontal position, of the meters (per single channel)"""
+        self._meterW = self.metersWidth()
+        self._meterH = self.metersHeight()
+        self._meterXs = [n * (self._meterW + self.metersSpacing) for n in range(self.metersCount())]
+
+    def metersPixels(self):
+        """Return the vertical position, in pixels, of the peak and decay indicators"""
+        meterHeight = self.metersHeight()
+        peakAreaHeight = meterHeight - 1
+
+        def toPixels(values):
+            return (meterHeight - np.clip(np.rint(values * peakAreaHeight), 0, peakAreaHeight)).astype(int).tolist()
+
+        return toPixels(self.peaks), toPixels(self.decayPeaks)
+
     def outerScaleWidth(self):
         return (
             max(
-                QFontMetrics(self.font()).width(str(self.scale.min)),
+                self._fm.width(str(self.scale.min)),
                 QFontMetrics(self.unitFont).boundingRect(self.unit).width(),
             )
             + 4
         )
 
     def plot(self, peaks: list, decayPeak: list = []):
-        peaks = peaks.copy()
-        decayPeak = decayPeak.copy()
-
-        # Normalize data and check for clipping
-        for n in range(len(peaks)):
-            self.clipping[n] = peaks[n] > self.scale.max
+        peaks = np.asarray(peaks, dtype=np.float32)
+        decayPeak = np.asarray(decayPeak, dtype=np.float32)[: len(peaks)]
 
-            peaks[n] = self.scale.scale(peaks[n])
-
-            if n >= len(decayPeak):
-                decayPeak.append(0)
-            else:
-                decayPeak[n] = self.scale.scale(decayPeak[n])
-
-        # Make transitioning from height to low peaks, smoother
-        for n in range(min(len(peaks), len(self.peaks))):
-            if self.valueSmoothing:
-                if peaks[n] < self.peaks[n]:
-                    peaks[n] = self.peaks[n] - self._currentSmoothing
-                    self._currentSmoothing *= 1.10
-                else:
-                    self._currentSmoothing = self.valueSmoothing
-
-        # If the number of "channels" has changed, we need to update the cached pixmaps
+        # If the number of "channels" has changed, we need new buffers, and to update the cached pixmaps
         updatePixmaps = len(peaks) != len(self.peaks)
+        if updatePixmaps:
+            self.peaks = np.zeros(len(peaks), dtype=np.float32)
+            self.decayPeaks = np.zeros(len(peaks), dtype=np.float32)
+            self.clipping = np.zeros(len(peaks), dtype=bool)
+            self._scaledPeaks = np.zeros(len(peaks), dtype=np.float32)
+            self._scaledFrom = np.full(len(peaks), np.nan, dtype=np.float32)
+
+        # Normalize data and check for clipping,
+        # the same peaks are often received many times in a row (e.g. silence, or clipping)
+        clipping = peaks > self.scale.max
+        if self._scaledWith is not self.scale or not np.array_equal(peaks, self._scaledFrom):
+            self._scaleInto(peaks, self._scaledPeaks)
+            self._scaledFrom[:] = peaks
+            self._scaledWith = self.scale
+
+        scaledPeaks = self._scaledPeaks
+
+        clippingChanged = (clipping != self.clipping).tolist()
+        self.clipping[:] = clipping
+
+        # Make transitioning from height to low peaks, smoother,
+        # depending on the elapsed time, not on how often we get new values
+        now = monotonic()
+        intervals = min(now - self._lastUpdate, 1) / self._SMOOTHING_INTERVAL
+        self._lastUpdate = now
+
+        if self.valueSmoothing:
+            falling = scaledPeaks < self.peaks
+            smoothed = np.maximum(self.peaks - self._currentSmoothing * intervals, scaledPeaks)
+            self.peaks[:] = np.where(falling, smoothed, scaledPeaks)
+
+            if falling.any():
+                self._currentSmoothing *= 1.10**intervals
+            else:
+                self._currentSmoothing = self.valueSmoothing
+        else:
+            self.peaks[:] = scaledPeaks
 
-        # Update the meters
-        self.peaks = peaks
-        self.decayPeaks = decayPeak
+        # Update the decay indicators, missing values are left at the bottom
+        self._scaleInto(decayPeak, self.decayPeaks[: len(decayPeak)])
+        self.decayPeaks[len(decayPeak) :] = 0
 
         # Update the pixmpas, if needed
         if updatePixmaps:
+            self.updateMetersGeometry()
             self.updateOuterScale()
             self.updateInnerScalePixmap()
             self.updateMeterPixmap()
 
+        peaksPx, decayPx = self.metersPixels()
+
+        # Nothing to redraw, if the meters would look exactly the same
+        if (
+            not updatePixmaps
+            and peaksPx == self._lastPeakPx
+            and decayPx == self._lastDecayPx
+            and not any(clippingChanged)
+        ):
+            return
+
         # Redraw the widget (queued, and executed in the Qt main-loop)
-        self.update(
-            0,
-            0,
-            self.width() - (self._outerScaleWidth if self._canDisplayOuterScale else 0),
-            self.height(),
-        )
+        if updatePixmaps:
+            self.update(
+                0,
+                0,
+                self.width() - (self._outerScaleWidth if self._canDisplayOuterScale else 0),
+                self.height(),
+            )
+        else:
+            # Only redraw the bands that changed since the last update
+            meterWidth = self._meterW
+            meterHeight = self._meterH
+            region = QRegion()
+
+            for n, x in enumerate(self._meterXs):
+                if clippingChanged[n]:
+                    region = region.united(QRect(x, 0, meterWidth + 1, meterHeight + 1))
+                    continue
+
+                prevPeak, peak = self._lastPeakPx[n], peaksPx[n]
+                if peak != prevPeak:
+                    region = region.united(QRect(x, min(peak, prevPeak) - 1, meterWidth + 1, abs(peak - prevPeak) + 3))
+
+                prevDecay, decay = self._lastDecayPx[n], decayPx[n]
+                if decay != prevDecay:
+                    region = region.united(QRect(x, prevDecay - 1, meterWidth + 1, 3))
+                    region = region.united(QRect(x, decay - 1, meterWidth + 1, 3))
+
+            self.update(region)
+
+        self._lastPeakPx = peaksPx
+        self._lastDecayPx = decayPx
+
+    def _scaleInto(self, values: np.ndarray, out: np.ndarray) -> np.ndarray:
+        """Scale the values into the given buffer, without allocating a new one when the scale allows it"""
+        if isinstance(self.scale, IECScale):
+            return self.scale.scale(values, out=out)
+
+        out[:] = self.scale.scale(values)
+        return out
 
     def updateMeterPixmap(self):
-        """Prepare the colored rect to be used during paintEvent(s)"""
+        """Prepare the colored rect to be used during paintEvent(s), the meter strips are rendered when first needed"""
         meterWidth = self.metersWidth()
         meterHeight = self.metersHeight()
         dbRange = abs(self.scale.min - self.scale.max)
 
-        gradient = QLinearGradient(0, 0, 0, meterHeight)
-        gradient.setColorAt(0, QColor(230, 0, 0))
-        gradient.setColorAt(10 / dbRange, QColor(255, 220, 0))
-        gradient.setColorAt(30 / dbRange, QColor(0, 220, 0))
-        gradient.setColorAt(1, QColor(0, 180, 50))
+        # The strips depend on the geometry, the gradient, the inner scale and the colors in use
+        self._stripsKey = "QDigitalMeter:strip:{}x{}:{}:{}:{}".format(
+            meterWidth,
+            meterHeight,
+            dbRange,
+            self.backgroundBrush.color().rgba(),
+            self._innerScaleKey,
+        )
+        self._strips = [None, None]
+
+        if meterWidth <= 0 or meterHeight <= 0:
+            self._meterPixmap = QPixmap()
+            return
+
+        key = f"QDigitalMeter:meter:{meterWidth}x{meterHeight}:{dbRange}"
+        self._meterPixmap = _findCachedPixmap(key)
+        if self._meterPixmap is None:
+            if dbRange != self._lastDbRange:
+                self._gradientStops = np.array([0, 10 / dbRange, 30 / dbRange, 1])
+                self._lastDbRange = dbRange
+
+            # Interpolate the gradient colors, one per row (0xAARRGGBB)
+            rows = (np.arange(meterHeight) + 0.5) / meterHeight
+            r, g, b = (np.rint(np.interp(rows, self._gradientStops, c)).astype(np.uint32) for c in self._gradientColors)
+            self._colorLUT = 0xFF000000 | (r << 16) | (g << 8) | b
+
+            # Replicate the colors for the whole width, QImage doesn't own the buffer,
+            # so we copy the image while the buffer is still alive
+            buffer = np.ascontiguousarray(np.broadcast_to(self._colorLUT[:, None], (meterHeight, meterWidth)))
+            image = QImage(buffer, meterWidth, meterHeight, meterWidth * 4, QImage.Format.Format_RGB32).copy()
 
-        self._meterPixmap = QPixmap(meterWidth, meterHeight)
-        QPainter(self._meterPixmap).fillRect(0, 0, meterWidth, meterHeight, gradient)
+            self._meterPixmap = QPixmap.fromImage(image)
+            QPixmapCache.insert(key, self._meterPixmap)
+
+    def _meterStrips(self, clipping: bool) -> Tuple[QPixmap, QPixmap]:
+        """Return the "unlit" and "lit" meter strips for the given clipping state
+
+        The strips are the whole meter pre-rendered (borders, background/gradient and inner markings),
+        so that each frame only needs to blit them.
+        """
+        strips = self._strips[clipping]
+        if strips is not None:
+            return strips
+
+        meterWidth = self._meterW
+        meterHeight = self._meterH
+        pen = self._pens[clipping]
+
+        strips = []
+        for fill in (None, self._meterPixmap):
+            key = f"{self._stripsKey}:{pen.color().rgba()}:{fill is not None}"
+            pixmap = _findCachedPixmap(key)
+            if pixmap is None:
+                pixmap = QPixmap(meterWidth + 1, meterHeight + 1)
+                if not pixmap.isNull():
+                    painter = QPainter(pixmap)
+                    painter.fillRect(0, 0, meterWidth, meterHeight, self.backgroundBrush)
+                    if fill is not None:
+                        painter.drawPixmap(1, 1, fill, 1, 1, meterWidth - 1, meterHeight - 1)
+                    painter.drawPixmap(1, 1, self._innerScalePixmap)
+                    painter.setPen(pen)
+                    painter.drawRect(0, 0, meterWidth, meterHeight)
+                    painter.end()
+
+                    QPixmapCache.insert(key, pixmap)
+
+            strips.append(pixmap)
+
+        self._strips[clipping] = strips = tuple(strips)
+        return strips
 
     def updateOuterScale(self):
-        self._outerScale = []
+        ys = []
+        levels = []
 
-        fm = QFontMetrics(self.font())
+        fm = self._fm
         height = self.metersHeight()
         # We assume that we're using numerals that lack descenders
         stepMixHeight = fm.ascent() * 1.25
+        scaleValue = self.scale.scaleValue
         currLevel = self.scale.max
         currY = 0
 
@@ -203,19 +431,45 @@ class QDigitalMeter(QWidget):
             prevLevel = currLevel
             prevY = currY + stepMixHeight
 
+            # Use the first step that places the indicator below prevY (or the last one)
             for step in self.steps:
                 currLevel = prevLevel - step
-                currY = height - self.scale.scale(currLevel) * height
+                currY = height - scaleValue(currLevel) * height
                 if currY > prevY:
                     break
 
             if currY < height - stepMixHeight:
-                self._outerScale.append([ceil(currY), currLevel])
+                ys.append(ceil(currY))
+                levels.append(currLevel)
+
+        self._outerScaleY = np.array(ys, dtype=np.int32)
+        self._outerScaleLevel = np.array(levels, dtype=np.int32)
+
+        # Prepare the scale marking text, and where to draw it
+        x = self.width() - self._outerScaleWidth
+        textHeight = fm.height()
+        textOffset = textHeight // 2
+
+        self._scaleMaxLabel = str(self.scale.max)
+        self._outerScaleLabels = tuple(str(level) for level in levels)
+        self._outerScaleRects = tuple(QRect(x, y - textOffset, self._outerScaleWidth, textHeight) for y in ys)
 
     def updateInnerScalePixmap(self):
         meterWidth = self.metersWidth()
         innerScaleX = meterWidth - max(meterWidth - meterWidth // 2, self.minMeterWidth)
 
+        key = "QDigitalMeter:innerScale:{}x{}:{}:{}:{}".format(
+            meterWidth,
+            self.height(),
+            innerScaleX,
+            self.borderPen.color().rgba(),
+            hash(self._outerScaleY.tobytes()),
+        )
+        self._innerScaleKey = key
+        self._innerScalePixmap = _findCachedPixmap(key)
+        if self._innerScalePixmap is not None:
+            return
+
         self._innerScalePixmap = QPixmap(meterWidth, self.height())
         self._innerScalePixmap.fill(Qt.GlobalColor.transparent)
 
@@ -226,68 +480,71 @@ class QDigitalMeter(QWidget):
         painter.setPen(self.borderPen)
         painter.setFont(self.font())
 
-        for mark in self._outerScale:
-            painter.drawLine(innerScaleX, mark[0], meterWidth, mark[0])
+        for y in self._outerScaleY.tolist():
+            painter.drawLine(innerScaleX, y, meterWidth, y)
+
+        painter.end()
+        QPixmapCache.insert(key, self._innerScalePixmap)
 
     def resizeEvent(self, event: QResizeEvent):
+        self.updateLayout()
+
+    def updateLayout(self):
+        # Also used to apply changes to the scale, do not reuse the scaled values
+        self._scaledWith = None
+        self._outerScaleWidth = self.outerScaleWidth()
         self._canDisplayOuterScale = self.metersWidth(True) >= self.minMeterWidth
 
+        self.updateMetersGeometry()
         self.updateOuterScale()
         self.updateInnerScalePixmap()
         self.updateMeterPixmap()
 
+        self._lastPeakPx, self._lastDecayPx = self.metersPixels()
+
     def paintEvent(self, event: QPaintEvent):
         painter = QPainter()
         painter.begin(self)
-        painter.setPen(self.borderPen)
-        painter.setBrush(self.backgroundBrush)
-
-        # Calculate the meter size (per single channel)
-        meterRect = QRectF(0, 0, self.metersWidth(), self.metersHeight())
-        peakAreaRect = meterRect.adjusted(1, 1, 0, 0)
-
-        # Draw each channel
-        for n, (peak, decayPeak) in enumerate(zip(self.peaks, self.decayPeaks)):
-            # Scale values to widget size
-            peak = peak * peakAreaRect.height()
-            decayPeak = decayPeak * peakAreaRect.height()
-
-            # Decide borders colors, depending on the "clipping" state
-            if self.clipping.get(n, False):
-                painter.setPen(self.clippingPen)
-            else:
-                painter.setPen(self.borderPen)
-
-            # Draw background and borders
-            painter.drawRect(meterRect)
-
-            # Draw peak (audio peak in dB)
-            peakRect = QRectF(0, peakAreaRect.bottom() - peak, peakAreaRect.width(), peak)
-            painter.drawPixmap(
-                peakRect.translated(peakAreaRect.x(), 0),
-                self._meterPixmap,
-                peakRect,
+        region = event.region()
+
+        meterWidth = self._meterW
+        stripWidth = meterWidth + 1
+        stripHeight = self._meterH + 1
+        clipping = self.clipping.tolist()
+
+        def fragment(x, sourceX, sourceY, width, height):
+            # Meters are drawn at the same vertical position they have in the strips
+            return QPainter.PixmapFragment.create(
+                QPointF(x + sourceX + width / 2, sourceY + height / 2),
+                QRectF(sourceX, sourceY, width, height),
             )
 
-            # Draw decay indicator
-            decayRect = QRectF(
-                0,
-                peakAreaRect.bottom() - decayPeak,
-                peakAreaRect.width(),
-                1,
-            )
-            painter.drawPixmap(
-                decayRect.translated(peakAreaRect.x(), 0),
-                self._meterPixmap,
-                decayRect,
-            )
-
-            # Draw inner markings
-            painter.drawPixmap(peakAreaRect.topLeft(), self._innerScalePixmap)
-
-            # Move to the next meter
-            meterRect.translate(meterRect.width() + self.metersSpacing, 0)
-            peakAreaRect.translate(meterRect.width() + self.metersSpacing, 0)
+        # Collect the fragments of each strip (indexed by the "clipping" state),
+        # so that all the channels are drawn with a single call per pixmap
+        unlitFragments = ([], [])
+        litFragments = ([], [])
+
+        for n, x in enumerate(self._meterXs):
+            # Skip the meters that don't need to be repainted
+            if not region.intersects(QRect(x, 0, stripWidth, stripHeight)):
+                continue
+
+            # Values already scaled to widget size
+            peakY = self._lastPeakPx[n]
+            decayY = self._lastDecayPx[n]
+
+            # The "unlit" part of the meter
+            unlitFragments[clipping[n]].append(fragment(x, 0, 0, stripWidth, peakY))
+            # Peak (audio peak in dB)
+            litFragments[clipping[n]].append(fragment(x, 0, peakY, stripWidth, stripHeight - peakY))
+            # Decay indicator
+            litFragments[clipping[n]].append(fragment(x, 1, decayY, meterWidth - 1, 1))
+
+        for isClipping in (False, True):
+            if unlitFragments[isClipping]:
+                unlitStrip, litStrip = self._meterStrips(isClipping)
+                _drawPixmapFragments(painter, unlitFragments[isClipping], unlitStrip)
+                _drawPixmapFragments(painter, litFragments[isClipping], litStrip)
 
         # Draw the meter scale, when needed
         if self._canDisplayOuterScale and event.region().contains(QPoint(self.width() - self._outerScaleWidth, 0)):
@@ -298,22 +555,16 @@ class QDigitalMeter(QWidget):
     def drawScale(self, painter: QPainter):
         # Draw the scale marking text
         x = self.width() - self._outerScaleWidth
-        textHeight = QFontMetrics(self.font()).height()
-        textOffset = textHeight / 2
 
         painter.setPen(self.textPen)
 
-        painter.drawText(QPointF(x, 0), str(self.scale.max))
-        for mark in self._outerScale:
-            painter.drawText(
-                QRectF(x, mark[0] - textOffset, self._outerScaleWidth, textHeight),
-                Qt.AlignVCenter | Qt.AlignRight,
-                str(mark[1]),
-            )
+        painter.drawText(QPoint(x, 0), self._scaleMaxLabel)
+        for rect, label in zip(self._outerScaleRects, self._outerScaleLabels):
+            painter.drawText(rect, Qt.AlignVCenter | Qt.AlignRight, label)
 
         # Draw the units that the scale uses
         painter.setFont(self.unitFont)
         painter.drawText(
-            QPointF(x + 2, self.metersHeight()),
+            QPoint(x + 2, self._meterH),
             self.unit,
         )
@@ -16,7 +16,24 @@
 # along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
 
 from abc import abstractmethod, ABC
+from bisect import bisect_right
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+
+
+@lru_cache(maxsize=None)
+def _iecScaleKernel():
+    """Load the optional numba kernel on first use, importing (and compiling) it is slow"""
+    try:
+        from qdigitalmeter._scale_numba import iecScaleBatch
+    except Exception:
+        # numba is not installed, or the kernel could not be compiled
+        return None
+
+    return iecScaleBatch
 
 
 class Scale(ABC):
@@ -24,37 +41,85 @@ class Scale(ABC):
     max: int
 
     @abstractmethod
-    def scale(self, value):
+    def scale(self, value: np.ndarray) -> np.ndarray:
         pass
 
+    def scaleValue(self, value: float) -> float:
+        """Scale a single value"""
+        return float(self.scale(value))
+
+    def inverse(self, normalized: np.ndarray) -> Optional[np.ndarray]:
+        """Return the values that scale() maps to the given [0-1] normalized values
+
+        By default scales are not invertible, and None is returned.
+        """
+        return None
+
 
 class IECScale(Scale):
     min: int = -70
     max: int = 0
 
-    def scale(self, value):
+    # Piecewise-linear segments, a value in [BOUNDS[i-1], BOUNDS[i]) is mapped
+    # as (value - _OFFSETS[i]) * _SLOPES[i] + _CONSTS[i]
+    _BOUNDS = np.array([-70.0, -60.0, -50.0, -40.0, -30.0, -20.0, 0.0])
+    _OFFSETS = np.array([0.0, -70.0, -60.0, -50.0, -40.0, -30.0, -20.0, 0.0])
+    _SLOPES = np.array([0.0, 0.25, 0.50, 0.75, 1.5, 2.0, 2.5, 0.0])
+    _CONSTS = np.array([0.0, 0.0, 5.0, 7.5, 15.0, 30.0, 50.0, 100.0])
+    # Normalized value at which each (non-constant) segment starts
+    _STARTS = _CONSTS[1:-1] / 100
+    # Plain python copies, NumPy overhead dominates when handling single values
+    _BOUNDS_LIST = _BOUNDS.tolist()
+    _SEGMENTS = tuple(zip(_OFFSETS.tolist(), _SLOPES.tolist(), _CONSTS.tolist()))
+
+    def scale(self, value: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
         """IEC 268-18:1995 standard dB scaling.
 
         Adapted from: http://plugin.org.uk/meterbridge/
+
+        :param out: Optional buffer, with the same shape of value, to store the results in
         """
-        scale = 100
-
-        if value < -70.0:
-            scale = 0.0
-        elif value < -60.0:
-            scale = (value + 70.0) * 0.25
-        elif value < -50.0:
-            scale = (value + 60.0) * 0.50 + 5
-        elif value < -40.0:
-            scale = (value + 50.0) * 0.75 + 7.5
-        elif value < -30.0:
-            scale = (value + 40.0) * 1.5 + 15
-        elif value < -20.0:
-            scale = (value + 30.0) * 2.0 + 30
-        elif value < 0:
-            scale = (value + 20.0) * 2.5 + 50
-
-        return scale / 100
+        # Use the compiled kernel, when available, for the buffers used by QDigitalMeter
+        if (
+            isinstance(value, np.ndarray)
+            and value.dtype == np.float32
+            and value.ndim == 1
+            and value.flags.c_contiguous
+            and (out is None or (out.dtype == np.float32 and out.flags.c_contiguous))
+        ):
+            kernel = _iecScaleKernel()
+            if kernel is not None:
+                if out is None:
+                    out = np.empty_like(value)
+                kernel(value, out)
+                return out
+
+        # Values outside the scale range fall in the constant segments,
+        # clamp them, so that infinite values are not multiplied by a zero slope,
+        # NaN values are mapped to the top of the scale
+        value = np.clip(np.nan_to_num(value, nan=self.max), self._BOUNDS[0], self._BOUNDS[-1])
+        idx = np.searchsorted(self._BOUNDS, value, side="right")
+
+        return np.divide((value - self._OFFSETS[idx]) * self._SLOPES[idx] + self._CONSTS[idx], 100, out=out)
+
+    def scaleValue(self, value: float) -> float:
+        # NaN values end-up past the last bound, as with scale()
+        idx = bisect_right(self._BOUNDS_LIST, value)
+        if idx == 0:
+            return 0.0
+        if idx == len(self._BOUNDS_LIST):
+            return 1.0
+
+        offset, slope, const = self._SEGMENTS[idx]
+        return ((value - offset) * slope + const) / 100
+
+    def inverse(self, normalized: np.ndarray) -> np.ndarray:
+        normalized = np.asarray(normalized)
+        # The segments are not contiguous, values falling between two of them are clamped to the closest one
+        idx = np.clip(np.searchsorted(self._STARTS, normalized, side="right"), 1, len(self._STARTS))
+        value = (normalized * 100 - self._CONSTS[idx]) / self._SLOPES[idx] + self._OFFSETS[idx]
+
+        return np.clip(value, self._BOUNDS[idx - 1], self._BOUNDS[idx])
 
 
 @dataclass
@@ -62,10 +127,17 @@ class LinearScale(Scale):
     min: int = -60
     max: int = 0
 
-    def scale(self, value):
-        if value < self.min:
-            return 0
-        elif value < self.max:
-            return (value - self.min) / (self.max - self.min)
+    def scale(self, value: np.ndarray) -> np.ndarray:
+        # NaN values are mapped to the top of the scale
+        value = np.nan_to_num(value, nan=self.max)
+        return np.clip((value - self.min) / (self.max - self.min), 0, 1)
+
+    def scaleValue(self, value: float) -> float:
+        if value != value:
+            # NaN values are mapped to the top of the scale
+            return 1.0
+
+        return min(max((value - self.min) / (self.max - self.min), 0.0), 1.0)
 
-        return 1
+    def inverse(self, normalized: np.ndarray) -> np.ndarray:
+        return np.clip(np.asarray(normalized), 0, 1) * (self.max - self.min) + self.min
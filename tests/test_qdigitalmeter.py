@@ -0,0 +1,143 @@
+from math import ceil
+
+import numpy as np
+import pytest
+from qtpy.QtGui import QFont
+
+from qdigitalmeter import QDigitalMeter
+from qdigitalmeter.scales import IECScale, LinearScale, Scale
+
+
+class SquareScale(Scale):
+    min = -60
+    max = 0
+
+    def scale(self, value):
+        return np.clip((np.asarray(value) - self.min) / (self.max - self.min), 0, 1) ** 2
+
+
+def referenceOuterScale(meter: QDigitalMeter):
+    """The original (probing) outer scale algorithm"""
+    marks = []
+    height = meter.metersHeight()
+    stepMixHeight = meter._fm.ascent() * 1.25
+    currLevel = meter.scale.max
+    currY = 0
+
+    while currY < height - stepMixHeight:
+        prevLevel = currLevel
+        prevY = currY + stepMixHeight
+
+        for step in meter.steps:
+            currLevel = prevLevel - step
+            currY = height - float(meter.scale.scale(currLevel)) * height
+            if currY > prevY:
+                break
+
+        if currY < height - stepMixHeight:
+            marks.append((ceil(currY), currLevel))
+
+    return marks
+
+
+@pytest.mark.parametrize(
+    "scale, steps",
+    [
+        (IECScale(), (5, 10, 20, 50)),
+        (IECScale(), (1, 3, 6, 12)),
+        (LinearScale(), (5, 10, 20, 50)),
+        (LinearScale(-90, 6), (5, 10, 20, 50)),
+        (LinearScale(-90, 6), (1, 3, 6, 12)),
+    ],
+)
+def test_outer_scale_matches_reference(qapp, scale, steps):
+    meter = QDigitalMeter(scale=scale, steps=steps)
+
+    for height in range(40, 901):
+        meter.resize(150, height)
+        meter.updateOuterScale()
+
+        marks = list(zip(meter._outerScaleY.tolist(), meter._outerScaleLevel.tolist()))
+        assert marks == referenceOuterScale(meter), f"height={height}"
+
+
+def test_plot_non_finite_values(qapp):
+    meter = QDigitalMeter()
+    meter.resize(150, 400)
+
+    meter.plot([float("-inf"), -30], [float("-inf"), -10])
+    meter.plot([float("nan"), -30], [float("nan"), -10])
+    meter.plot([float("inf"), -30], [float("inf"), -10])
+
+    assert meter.peaks.tolist()[0] == 1
+    assert meter.clipping.tolist() == [True, False]
+
+
+def test_unit_font_change_updates_layout(qapp):
+    meter = QDigitalMeter()
+    meter.resize(150, 400)
+    width = meter._outerScaleWidth
+
+    font = QFont(meter.unitFont)
+    font.setPointSize(font.pointSize() * 4)
+    meter.unitFont = font
+
+    assert meter._outerScaleWidth > width
+    assert meter._outerScaleWidth == meter.outerScaleWidth()
+
+
+def test_outer_scale_without_inverse(qapp):
+    meter = QDigitalMeter(scale=SquareScale())
+
+    for height in range(40, 901, 7):
+        meter.resize(150, height)
+        meter.updateOuterScale()
+
+        marks = list(zip(meter._outerScaleY.tolist(), meter._outerScaleLevel.tolist()))
+        assert marks == referenceOuterScale(meter), f"height={height}"
+
+
+def test_meter_strips_cached(qapp):
+    meter = QDigitalMeter()
+    meter.resize(150, 400)
+    meter.plot([-10, -20])
+    meter.grab()
+
+    # The clipping variants are only rendered when needed
+    assert meter._strips[True] is None
+
+    other = QDigitalMeter()
+    other.resize(150, 400)
+    other.grab()
+
+    assert other._stripsKey == meter._stripsKey
+    for strip, otherStrip in zip(meter._meterStrips(False), other._meterStrips(False)):
+        assert strip.cacheKey() == otherStrip.cacheKey()
+
+
+def test_plot_reuses_scaled_peaks(qapp):
+    class CountingScale(LinearScale):
+        calls = 0
+
+        def scale(self, value):
+            # Only count the peaks, decay values are not given
+            self.calls += bool(np.size(value))
+            return super().scale(value)
+
+    scale = CountingScale()
+    meter = QDigitalMeter(scale=scale)
+    meter.resize(150, 400)
+
+    meter.plot([-10, -20])
+    meter.plot([-10, -20])
+    assert scale.calls == 1
+
+    meter.plot([-10, -30])
+    assert scale.calls == 2
+    assert meter._scaledPeaks.tolist() == pytest.approx([50 / 60, 0.5])
+
+    scale.min = -90
+    meter.updateLayout()
+    meter.plot([-10, -30])
+    assert scale.calls == 3
+    assert meter._scaledPeaks.tolist() == pytest.approx([80 / 90, 60 / 90])
@@ -0,0 +1,86 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pytest
+
+from qdigitalmeter import scales
+from qdigitalmeter.scales import IECScale, LinearScale, Scale
+
+
+@pytest.fixture(params=["numpy", "numba"])
+def iecScale(request, monkeypatch):
+    if request.param == "numba":
+        if scales._iecScaleKernel() is None:
+            pytest.skip("numba is not available")
+    else:
+        monkeypatch.setattr(scales, "_iecScaleKernel", lambda: None)
+
+    return IECScale()
+
+
+@pytest.mark.parametrize("scale", [LinearScale(), LinearScale(-90, 6)])
+@pytest.mark.parametrize("value, expected", [(-np.inf, 0), (np.inf, 1), (np.nan, 1)])
+def test_linear_scale_non_finite_values(scale, value, expected):
+    values = np.array([value], dtype=np.float32)
+
+    assert scale.scale(values).tolist() == [expected]
+
+
+@pytest.mark.parametrize("value, expected", [(-np.inf, 0), (np.inf, 1), (np.nan, 1)])
+def test_iec_scale_non_finite_values(iecScale, value, expected):
+    values = np.array([value, -30], dtype=np.float32)
+
+    assert iecScale.scale(values).tolist() == pytest.approx([expected, 0.3])
+
+
+def test_scale_value_unhashable_scale():
+    @dataclass(eq=True)
+    class HalfScale(Scale):
+        min: int = -60
+        max: int = 0
+
+        def scale(self, value):
+            return np.asarray(value) / 2
+
+        def inverse(self, normalized):
+            return np.asarray(normalized) * 2
+
+    scale = HalfScale()
+    assert scale.scaleValue(-10) == -5
+    assert scale.scaleValue(-10) == -5
+
+
+def test_scale_value_follows_changes():
+    scale = LinearScale(-60, 0)
+    assert scale.scaleValue(-30) == pytest.approx(0.5)
+
+    scale.min = -90
+    assert scale.scaleValue(-30) == pytest.approx(2 / 3)
+
+
+def test_iec_scale_out_buffer(iecScale):
+    values = np.array([-80, -30, 0], dtype=np.float32)
+    out = np.zeros(3, dtype=np.float32)
+
+    assert iecScale.scale(values, out=out) is out
+    assert out.tolist() == pytest.approx([0, 0.3, 1])
+
+
+@pytest.mark.parametrize("scale", [IECScale(), LinearScale(), LinearScale(-90, 6)])
+def test_scale_value_matches_scale(scale):
+    values = [-np.inf, -100, -70, -65.5, -60, -55, -50, -42, -30, -20, -7.25, 0, 6, 12, np.inf, np.nan]
+
+    assert [scale.scaleValue(value) for value in values] == scale.scale(np.array(values)).tolist()
+
+
+def test_scale_without_inverse():
+    class SquareScale(Scale):
+        min = -60
+        max = 0
+
+        def scale(self, value):
+            return np.clip((np.asarray(value) - self.min) / (self.max - self.min), 0, 1) ** 2
+
+    scale = SquareScale()
+    assert scale.inverse(0.5) is None
+    assert scale.scaleValue(-30) == pytest.approx(0.25)